@@ -2,10 +2,21 @@ import logging
 from typing import Optional, Dict, Any
 import time
 import threading
-from queue import Queue
+from queue import Queue, Empty
 import subprocess
 import os
 
+# Spoken form of each hour for time announcements (midnight and twelve handled separately)
+HOURS_SPOKEN = {
+    1: "one", 2: "two", 3: "three", 4: "four",
+    5: "five", 6: "six", 7: "seven", 8: "eight",
+    9: "nine", 10: "ten", 11: "eleven",
+    13: "thirteen", 14: "fourteen", 15: "fifteen",
+    16: "sixteen", 17: "seventeen", 18: "eighteen",
+    19: "nineteen", 20: "twenty", 21: "twenty one",
+    22: "twenty two", 23: "twenty three"
+}
+
 class AnnouncementConfig:
     """Configuration for the announcements module"""
     def __init__(self,
@@ -69,6 +80,15 @@ class AnnouncementManager:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
         
+        # Message builders for each announcement type
+        self.message_builders = {
+            "delay": self._delay_message,
+            "platform_change": self._platform_change_message,
+            "cancellation": self._cancellation_message,
+            "departure": self._departure_message,
+            "next_train": self._next_train_message
+        }
+        
         # Lock for synchronizing announcements
         self.announcement_lock = threading.Lock()
         
@@ -90,12 +110,12 @@ class AnnouncementManager:
         """Process announcements from the queue"""
         while self.running:
             try:
-                if not self.announcement_queue.empty():
-                    announcement = self.announcement_queue.get()
-                    self._speak_announcement(announcement)
-                    time.sleep(self.config.announcement_gap)
-                else:
-                    time.sleep(0.1)  # Prevent busy-waiting
+                # Wait for the next announcement instead of polling the queue
+                announcement = self.announcement_queue.get(timeout=0.1)
+                self._speak_announcement(announcement)
+                time.sleep(self.config.announcement_gap)
+            except Empty:
+                continue
             except Exception as e:
                 self.logger.error("Error processing announcement queue: %s", str(e))
     
@@ -114,16 +134,7 @@ class AnnouncementManager:
                 elif hours == 12:
                     hours_spoken = "twelve"
                 else:
-                    hours_map = {
-                        1: "one", 2: "two", 3: "three", 4: "four",
-                        5: "five", 6: "six", 7: "seven", 8: "eight",
-                        9: "nine", 10: "ten", 11: "eleven",
-                        13: "thirteen", 14: "fourteen", 15: "fifteen",
-                        16: "sixteen", 17: "seventeen", 18: "eighteen",
-                        19: "nineteen", 20: "twenty", 21: "twenty one",
-                        22: "twenty two", 23: "twenty three"
-                    }
-                    hours_spoken = hours_map.get(hours, str(hours))
+                    hours_spoken = HOURS_SPOKEN.get(hours, str(hours))
                 
                 # Format minutes
                 if minutes == 0:
@@ -142,49 +153,56 @@ class AnnouncementManager:
             self.logger.error(f"Failed to format time {time_str}: {str(e)}")
             return time_str
     
+    def _delay_message(self, announcement: Dict[str, Any]) -> str:
+        """Build the message for a delay announcement"""
+        message = (
+            f"Attention please. "
+            f"The {self._format_time(announcement['scheduled_time'])} service "
+            f"to {announcement['destination']} "
+        )
+        if announcement['expected_time'] == "Delayed":
+            message += "is delayed."
+        else:
+            message += f"is delayed until {self._format_time(announcement['expected_time'])}."
+        return message
+    
+    def _platform_change_message(self, announcement: Dict[str, Any]) -> str:
+        """Build the message for a platform change announcement"""
+        return (
+            f"Attention please. "
+            f"The {self._format_time(announcement['scheduled_time'])} service "
+            f"to {announcement['destination']} "
+            f"has been moved from platform {announcement['old_platform']} "
+            f"to platform {announcement['new_platform']}."
+        )
+    
+    def _cancellation_message(self, announcement: Dict[str, Any]) -> str:
+        """Build the message for a cancellation announcement"""
+        return (
+            f"Attention please. "
+            f"We regret to announce that the "
+            f"{self._format_time(announcement['scheduled_time'])} service "
+            f"to {announcement['destination']} has been cancelled."
+        )
+    
+    def _departure_message(self, announcement: Dict[str, Any]) -> str:
+        """Build the message for a departure announcement"""
+        return (
+            f"The {self._format_time(announcement['scheduled_time'])} service "
+            f"to {announcement['destination']} "
+            f"from platform {announcement['platform']} "
+            f"is now departing."
+        )
+    
+    def _next_train_message(self, announcement: Dict[str, Any]) -> str:
+        """Next train and line status announcements carry a prepared message"""
+        return announcement["message"]
+    
     def _speak_announcement(self, announcement: Dict[str, Any]):
         """Speak an announcement using text-to-speech"""
         try:
-            message = ""
-            
-            if announcement["type"] == "delay":
-                message = (
-                    f"Attention please. "
-                    f"The {self._format_time(announcement['scheduled_time'])} service "
-                    f"to {announcement['destination']} "
-                )
-                if announcement['expected_time'] == "Delayed":
-                    message += "is delayed."
-                else:
-                    message += f"is delayed until {self._format_time(announcement['expected_time'])}."
-                
-            elif announcement["type"] == "platform_change":
-                message = (
-                    f"Attention please. "
-                    f"The {self._format_time(announcement['scheduled_time'])} service "
-                    f"to {announcement['destination']} "
-                    f"has been moved from platform {announcement['old_platform']} "
-                    f"to platform {announcement['new_platform']}."
-                )
-                
-            elif announcement["type"] == "cancellation":
-                message = (
-                    f"Attention please. "
-                    f"We regret to announce that the "
-                    f"{self._format_time(announcement['scheduled_time'])} service "
-                    f"to {announcement['destination']} has been cancelled."
-                )
-                
-            elif announcement["type"] == "departure":
-                message = (
-                    f"The {self._format_time(announcement['scheduled_time'])} service "
-                    f"to {announcement['destination']} "
-                    f"from platform {announcement['platform']} "
-                    f"is now departing."
-                )
-                
-            elif announcement["type"] == "next_train":
-                message = announcement["message"]
+            builder = self.message_builders.get(announcement["type"])
+            message = builder(announcement) if builder else ""
             
             if message:
                 with self.announcement_lock:
@@ -72,6 +72,10 @@ def main():
         if config['hoursPattern'].match(config['screenBlankHours']):
             blankHours = [int(x) for x in config['screenBlankHours'].split('-')]
 
+        announce_hours = []
+        if config['hoursPattern'].match(config['announcements']['operating_hours']):
+            announce_hours = [int(x) for x in config['announcements']['operating_hours'].split('-')]
+
         running = True
         while running:
             # Check if we need to stop (for preview mode)
@@ -120,11 +124,6 @@ def main():
                                 # Check if announcements are enabled and not muted
                                 if (config["announcements"]["enabled"] and 
                                     not config["announcements"]["muted"]):
-                                    # Check operating hours
-                                    announce_hours = []
-                                    if config['hoursPattern'].match(config['announcements']['operating_hours']):
-                                        announce_hours = [int(x) for x in config['announcements']['operating_hours'].split('-')]
-                                    
                                     # Only announce if within operating hours (or if no hours specified)
                                     if not announce_hours or isRun(announce_hours[0], announce_hours[1]):
                                         
@@ -177,11 +176,6 @@ def main():
                                     # Check if announcements are enabled and not muted
                                     if (config["announcements"]["enabled"] and 
                                         not config["announcements"]["muted"]):
-                                        # Check operating hours
-                                        announce_hours = []
-                                        if config['hoursPattern'].match(config['announcements']['operating_hours']):
-                                            announce_hours = [int(x) for x in config['announcements']['operating_hours'].split('-')]
-                                        
                                         # Only announce if within operating hours (or if no hours specified)
                                         if not announce_hours or isRun(announce_hours[0], announce_hours[1]):
                                             
@@ -1,7 +1,11 @@
+from collections import OrderedDict
 from datetime import datetime
 from PIL import Image, ImageDraw
 from luma.core.virtual import viewport, snapshot
 
+# Maximum number of rendered text bitmaps kept per renderer
+BITMAP_CACHE_SIZE = 512
+
 class BaseRenderer:
     def __init__(self, font, fontBold, fontBoldTall, fontBoldLarge, config):
         self.font = font
@@ -14,34 +18,48 @@ class BaseRenderer:
         self.pixelsLeft = 1
         self.pixelsUp = 0
         self.hasElevated = 0
-        self.bitmapRenderCache = {}
+        self.bitmapRenderCache = OrderedDict()
+        self.textLengthCache = {}
+        self.debugImage = None
 
     def cachedBitmapText(self, text, font):
         # cache the bitmap representation of the stations string
-        nameTuple = font.getname()
-        fontKey = ''
-        for item in nameTuple:
-            fontKey = fontKey + item
-        key = text + fontKey
+        # keyed on the font object itself, as one face is loaded at several sizes
+        key = (text, font)
         if key in self.bitmapRenderCache:
-            # found in cache; re-use it
+            # found in cache; re-use it and mark as most recently used
+            self.bitmapRenderCache.move_to_end(key)
             pre = self.bitmapRenderCache[key]
             bitmap = pre['bitmap']
             txt_width = pre['txt_width']
             txt_height = pre['txt_height']
         else:
             # not cached; create a new image containing the string as a monochrome bitmap
-            _, _, txt_width, txt_height = font.getbbox(text)
+            # lay the text out once and take the size from the rendered mask rather than getbbox
+            mask, offset = font.getmask2(text, mode='L')
+            txt_width, txt_height = offset[0] + mask.size[0], offset[1] + mask.size[1]
             bitmap = Image.new('L', [txt_width, txt_height], color=0)
             pre_render_draw = ImageDraw.Draw(bitmap)
-            pre_render_draw.text((0, 0), text=text, font=font, fill=255)
+            # getmask2 returns a core image that has no public wrapper, so blit it the way
+            # ImageDraw.text does internally; public draw.text would lay the string out again
+            pre_render_draw.draw.draw_bitmap(offset, mask, 255)
             # save to render cache
             self.bitmapRenderCache[key] = {'bitmap': bitmap, 'txt_width': txt_width, 'txt_height': txt_height}
+            # evict the least recently used string, e.g. clock times that have passed
+            if len(self.bitmapRenderCache) > BITMAP_CACHE_SIZE:
+                self.bitmapRenderCache.popitem(last=False)
         return txt_width, txt_height, bitmap
 
+    def cachedTextLength(self, text, font):
+        # cache the advance width of strings measured on every redraw
+        key = (text, font)
+        if key not in self.textLengthCache:
+            self.textLengthCache[key] = font.getlength(text)
+        return self.textLengthCache[key]
+
     def drawBlankSignage(self, device, width, height, departureStation):
-        welcomeSize = int(self.fontBold.getlength("Welcome to"))
-        stationSize = int(self.fontBold.getlength(departureStation))
+        welcomeSize = int(self.cachedTextLength("Welcome to", self.fontBold))
+        stationSize = int(self.cachedTextLength(departureStation, self.fontBold))
 
         device.clear()
 
@@ -205,18 +223,24 @@ class BaseRenderer:
         if draw is None:
             def drawText(draw, width=None, height=None, x=0, y=0):
                 text = ".  .  ."
-                draw.text((x, y), text=text, font=self.fontBold, fill="yellow")
+                _, _, bitmap = self.cachedBitmapText(text, self.fontBold)
+                draw.bitmap((x, y), bitmap, fill="yellow")
             return drawText
         else:
             text = ".  .  ."
-            draw.text((0, 0), text=text, font=self.fontBold, fill="yellow")
+            _, _, bitmap = self.cachedBitmapText(text, self.fontBold)
+            draw.bitmap((0, 0), bitmap, fill="yellow")
 
     def drawDebugScreen(self, device, width, height, showTime=False, screen="1"):
         """Draw debug information screen"""
         virtualViewport = viewport(device, width=width, height=height)
 
-        # Create a new image for drawing
-        image = Image.new('1', (width, height), 0)
+        # Reuse the debug frame between refreshes, clearing it in place
+        if self.debugImage is None or self.debugImage.size != (width, height):
+            self.debugImage = Image.new('1', (width, height), 0)
+        else:
+            self.debugImage.paste(0, (0, 0, width, height))
+        image = self.debugImage
         draw = ImageDraw.Draw(image)
 
         # Draw debug text
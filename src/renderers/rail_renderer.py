@@ -10,9 +10,9 @@ class RailRenderer(BaseRenderer):
         image = Image.new('1', (width, height), 0)  # 0 = black in mode "1"
         draw = ImageDraw.Draw(image)
 
-        nameSize = int(self.fontBold.getlength("UK Train Departure Display"))
-        poweredSize = int(self.fontBold.getlength("Powered by"))
-        attributionSize = int(self.fontBold.getlength("National Rail Enquiries"))
+        nameSize = int(self.cachedTextLength("UK Train Departure Display", self.fontBold))
+        poweredSize = int(self.cachedTextLength("Powered by", self.fontBold))
+        attributionSize = int(self.cachedTextLength("National Rail Enquiries", self.fontBold))
 
         rowOne = snapshot(width, 10, self.renderName((width - nameSize) / 2), interval=10)
         rowThree = snapshot(width, 10, self.renderPoweredBy((width - poweredSize) / 2), interval=10)
@@ -49,14 +49,14 @@ class RailRenderer(BaseRenderer):
 
         departures, firstDepartureDestinations, departureStation = data
 
-        w = int(self.font.getlength(callingAt))
+        w = int(self.cachedTextLength(callingAt, self.font))
 
         callingWidth = w
         width = virtualViewport.width
 
         # First measure the text size
-        w = int(self.font.getlength(status))
-        pw = int(self.font.getlength("Plat 88"))
+        w = int(self.cachedTextLength(status, self.font))
+        pw = int(self.cachedTextLength("Plat 88", self.font))
 
         if not departures:
             noTrains = self.drawBlankSignage(device, width=width, height=height, departureStation=departureStation)
@@ -1,9 +1,29 @@
 import time
 import logging
+from functools import lru_cache
 from src.tfl_status_detailed import get_detailed_line_status
 
 logger = logging.getLogger(__name__)
 
+# get_detailed_line_status reports failures as text rather than raising
+STATUS_ERROR_PREFIXES = ("Error fetching line status", "Unexpected response format")
+
+class LineStatusUnavailable(Exception):
+    """Raised when the TfL status lookup fails"""
+
+def _query_line_status(line_name):
+    """Fetch a line's status, raising LineStatusUnavailable on failure"""
+    status = get_detailed_line_status(line_name)
+    if status.startswith(STATUS_ERROR_PREFIXES):
+        raise LineStatusUnavailable(status)
+    return status
+
+@lru_cache(maxsize=64)
+def _fetch_line_status(line_name, interval_bucket):
+    """Fetch a line's status at most once per query interval, shared by all screens"""
+    # Failures raise, so lru_cache never stores them and the next caller retries
+    return _query_line_status(line_name)
+
 class StatusManager:
     def __init__(self, config, font):
         self.config = config
@@ -12,9 +32,10 @@ class StatusManager:
         self.last_status_query = 0
         self.last_status_announcement = 0
         self.current_line_status = None
-        self.status_display_start = 0
+        self.current_status_text = None  # Single-line form of the status for display
+        self.status_display_deadline = 0  # Monotonic time the current status display ends
         self.last_shown_status = None  # Track last shown status
-        self.last_shown_time = 0  # Track when status was last shown
+        self.reshow_deadline = None  # Monotonic time the last shown status is due again
         
         # Status animation states
         self.showing_status = False
@@ -39,13 +60,24 @@ class StatusManager:
                 line_name = current_departures[0].get('line', '').lower()
             
             if line_name:
-                new_status = get_detailed_line_status(line_name)
+                query_interval = self.config["tfl"]["status"]["queryInterval"]
+                try:
+                    if query_interval > 0:
+                        new_status = _fetch_line_status(line_name, int(current_time // query_interval))
+                    else:
+                        # An interval of 0 queries on every refresh, so there is nothing to share
+                        new_status = _query_line_status(line_name)
+                except LineStatusUnavailable as e:
+                    # Don't show or announce the error text as if it were a status
+                    logger.warning(f"Line status unavailable: {e}")
+                    new_status = None
                 logger.info(f"Checking status update - Current: {self.current_line_status}, New: {new_status}, Last shown: {self.last_shown_status}, Showing: {self.showing_status}")
                 
                 logger.info(f"Status check - New: {new_status}, Current: {self.current_line_status}, Last shown: {self.last_shown_status}")
                 
                 # Always update current status
                 self.current_line_status = new_status
+                self.current_status_text = new_status.replace("\n", " ") if new_status else new_status
                 
                 # If status has changed, reset last shown to force display
                 if new_status != self.last_shown_status:
@@ -89,12 +121,11 @@ class StatusManager:
             self.showing_status = False
             return False
             
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # First check if reshow interval has passed, regardless of current showing state
-        if (self.last_shown_time > 0 and 
-            current_time - self.last_shown_time >= self.config["tfl"]["status"]["reshowInterval"]):
-            logger.info(f"Reshow interval passed ({current_time - self.last_shown_time}s), resetting last shown status")
+        if self.reshow_deadline is not None and current_time >= self.reshow_deadline:
+            logger.info(f"Reshow interval passed ({current_time - self.reshow_deadline}s overdue), resetting last shown status")
             self.last_shown_status = None
             # If currently showing, let it finish naturally
             if not self.showing_status:
@@ -108,10 +139,9 @@ class StatusManager:
             # Show if we have a third departure and status needs showing
             if len(current_departures) > 2 and self.last_shown_status is None:
                 # Calculate text width and set display duration
-                status_text = self.current_line_status.replace("\n", " ")
-                text_width, _, _ = cached_bitmap_text(status_text, self.font)
-                self.status_display_start = time.time()
+                text_width, _, _ = cached_bitmap_text(self.current_status_text, self.font)
                 self.status_duration = self.calculate_scroll_duration(text_width)
+                self.status_display_deadline = current_time + self.status_duration
                 logger.info(f"Starting status display, duration: {self.status_duration}s")
                 self.showing_status = True
                 self.statusElevated = False
@@ -120,8 +150,7 @@ class StatusManager:
                 return True
         # If we are showing status, check if we should continue
         else:
-            current_time = time.time()
-            if current_time - self.status_display_start < self.status_duration:
+            if current_time < self.status_display_deadline:
                 return True
             else:
                 # Reset status display and animation states
@@ -134,7 +163,7 @@ class StatusManager:
                 if self.current_line_status:  # Only update last shown if we have a status
                     logger.info(f"Marking status as shown - Current: {self.current_line_status}")
                     self.last_shown_status = self.current_line_status
-                    self.last_shown_time = time.time()  # Track when we showed it
+                    self.reshow_deadline = current_time + self.config["tfl"]["status"]["reshowInterval"]
                     logger.info(f"Status state after marking shown - Current: {self.current_line_status}, Last shown: {self.last_shown_status}")
                 logger.info("Returning to departure 3")
                 return False
@@ -145,71 +174,49 @@ class StatusManager:
         """Render the current line status"""
         if draw is None:
             def drawText(draw, width=None, height=None, x=0, y=0):
-                if self.current_line_status:
-                    # Replace newlines with spaces
-                    status_text = self.current_line_status.replace("\n", " ")
-                    text_width, text_height, bitmap = cached_bitmap_text(status_text, self.font)
-                    
-                    # Always start with roll-up animation
-                    if not self.statusElevated:
-                        draw.bitmap((x, y + text_height - self.statusPixelsUp), bitmap, fill="yellow")
-                        if self.statusPixelsUp == text_height:
-                            self.statusPauseCount += 1
-                            if self.statusPauseCount > 20:
-                                self.statusElevated = True
-                                self.statusPixelsUp = 0
-                                self.statusPixelsLeft = 0  # Start from left edge
-                        else:
-                            self.statusPixelsUp = self.statusPixelsUp + 1
-                    else:
-                        # Horizontal scroll after elevation
-                        draw.bitmap((x + self.statusPixelsLeft - 1, y), bitmap, fill="yellow")
-                        if -self.statusPixelsLeft > text_width:  # If scrolled past end
-                            if self.statusPauseCount < 8:  # Pause briefly at end
-                                self.statusPauseCount += 1
-                            else:
-                                # End status display
-                                logger.info(f"Status animation complete - Current: {self.current_line_status}, Last shown: {self.last_shown_status}")
-                                self.showing_status = False
-                                self.statusPauseCount = 0
-                                self.statusPixelsLeft = 0
-                                self.statusElevated = False
-                                self.statusPixelsUp = 0
-                                # Don't update last_shown_status here, it's handled in should_show_status
-                        else:
-                            self.statusPixelsLeft = self.statusPixelsLeft - 1  # Scroll slower
+                self._draw_line_status(draw, x, y, cached_bitmap_text)
             return drawText
         else:
-            if self.current_line_status:
-                # Replace newlines with spaces
-                status_text = self.current_line_status.replace("\n", " ")
-                text_width, text_height, bitmap = cached_bitmap_text(status_text, self.font)
-                
-                # Always start with roll-up animation
-                if not self.statusElevated:
-                    draw.bitmap((0, text_height - self.statusPixelsUp), bitmap, fill="yellow")
-                    if self.statusPixelsUp == text_height:
-                        self.statusPauseCount += 1
-                        if self.statusPauseCount > 20:
-                            self.statusElevated = True
-                            self.statusPixelsUp = 0
-                            self.statusPixelsLeft = 0  # Start from left edge
-                    else:
-                        self.statusPixelsUp = self.statusPixelsUp + 1
-                else:
-                    # Horizontal scroll after elevation
-                    draw.bitmap((self.statusPixelsLeft - 1, 0), bitmap, fill="yellow")
-                    if -self.statusPixelsLeft > text_width:  # If scrolled past end
-                        if self.statusPauseCount < 8:  # Pause briefly at end
-                            self.statusPauseCount += 1
-                        else:
-                            # End status display
-                            logger.info(f"Status animation complete - Current: {self.current_line_status}, Last shown: {self.last_shown_status}")
-                            self.showing_status = False
-                            self.statusPauseCount = 0
-                            self.statusPixelsLeft = 0
-                            self.statusElevated = False
-                            self.statusPixelsUp = 0
-                            # Don't update last_shown_status here, it's handled in should_show_status
-                    else:
-                        self.statusPixelsLeft = self.statusPixelsLeft - 1  # Scroll slower
+            self._draw_line_status(draw, 0, 0, cached_bitmap_text)
+
+    def _draw_line_status(self, draw, x, y, cached_bitmap_text):
+        """Draw one frame of the line status and advance the animation"""
+        if not self.current_line_status:
+            return
+
+        text_width, text_height, bitmap = cached_bitmap_text(self.current_status_text, self.font)
+
+        # Always start with roll-up animation, then scroll horizontally
+        if not self.statusElevated:
+            draw.bitmap((x, y + text_height - self.statusPixelsUp), bitmap, fill="yellow")
+        else:
+            draw.bitmap((x + self.statusPixelsLeft - 1, y), bitmap, fill="yellow")
+
+        self._step_status_animation(text_width, text_height)
+
+    def _step_status_animation(self, text_width, text_height):
+        """Advance the roll-up and scroll state by a single frame"""
+        if not self.statusElevated:
+            if self.statusPixelsUp >= text_height:
+                self.statusPixelsUp = text_height  # Status text may have changed height mid roll-up
+                self.statusPauseCount += 1
+                if self.statusPauseCount > 20:
+                    self.statusElevated = True
+                    self.statusPixelsUp = 0
+                    self.statusPixelsLeft = 0  # Start from left edge
+            else:
+                self.statusPixelsUp = self.statusPixelsUp + 1
+        elif -self.statusPixelsLeft > text_width:  # If scrolled past end
+            if self.statusPauseCount < 8:  # Pause briefly at end
+                self.statusPauseCount += 1
+            else:
+                # End status display
+                logger.info(f"Status animation complete - Current: {self.current_line_status}, Last shown: {self.last_shown_status}")
+                self.showing_status = False
+                self.statusPauseCount = 0
+                self.statusPixelsLeft = 0
+                self.statusElevated = False
+                self.statusPixelsUp = 0
+                # Don't update last_shown_status here, it's handled in should_show_status
+        else:
+            self.statusPixelsLeft = self.statusPixelsLeft - 1  # Scroll slower
@@ -10,6 +10,8 @@ class ViewportManager:
         self.font = font
         self.fontBold = fontBold
         self.hotspots = []
+        self.blank_images = {}
+        self.dimensions_cache = {}
 
     def create_viewport(self, device, width, height):
         """Create a new viewport with the given dimensions"""
@@ -21,6 +23,10 @@ class ViewportManager:
 
     def calculate_dimensions(self, status_text):
         """Calculate dimensions for viewport layout"""
+        # Column widths only depend on the text measured, so compute them once
+        if status_text in self.dimensions_cache:
+            return self.dimensions_cache[status_text]
+
         w = int(self.font.getlength(status_text))
         pw = int(self.font.getlength("Plat 88")) if self.config["tfl"]["showPlatform"] else 0
         tw = int(self.font.getlength("88 mins"))  # Width for time to arrival
@@ -29,13 +35,15 @@ class ViewportManager:
         # Calculate total spacing based on visible columns
         total_spacing = spacing * (3 if self.config["tfl"]["showPlatform"] else 2)
 
-        return {
+        dimensions = {
             'status_width': w,
             'platform_width': pw,
             'time_width': tw,
             'spacing': spacing,
             'total_spacing': total_spacing
         }
+        self.dimensions_cache[status_text] = dimensions
+        return dimensions
 
     def clear_hotspots(self, viewport):
         """Clear all hotspots from the viewport"""
@@ -48,8 +56,31 @@ class ViewportManager:
         viewport.add_hotspot(snapshot, (x, y))
 
     def create_blank_image(self, width, height):
-        """Create a new blank image for drawing"""
-        return Image.new('1', (width, height), 0)  # 0 = black in mode "1"
+        """Return a blank image of the given size, shared between calls"""
+        size = (width, height)
+        if size not in self.blank_images:
+            self.blank_images[size] = Image.new('1', size, 0)  # 0 = black in mode "1"
+        return self.blank_images[size]
+
+    def column_positions(self, width, dimensions, platform_enabled=True):
+        """Calculate the x position of each departure column"""
+        w = dimensions['status_width']
+        pw = dimensions['platform_width']
+        tw = dimensions['time_width']
+        spacing = dimensions['spacing']
+
+        # Fail before any rendering if the fixed-width columns leave no room for the destination
+        if width - w - pw - tw - dimensions['total_spacing'] < 0:
+            raise ValueError(f"Departure columns are wider than the {width}px display")
+
+        column_x = {
+            'destination': 0,
+            'time': width - w - pw - tw - spacing * (2 if platform_enabled else 1),
+            'status': width - w - (pw + spacing if platform_enabled else 0)
+        }
+        if platform_enabled:
+            column_x['platform'] = width - pw
+        return column_x
 
     def position_hotspots(self, viewport, dimensions, rows, platform_enabled=True):
         """Position all hotspots in the viewport"""
@@ -57,6 +88,9 @@ class ViewportManager:
         
         width = viewport.width
 
+        # Look up column x positions by component type
+        column_x = self.column_positions(width, dimensions, platform_enabled) if dimensions else {}
+
         # Add hotspots for each row
         for row_name, row_data in rows.items():
             if row_data['components']:
@@ -64,25 +98,11 @@ class ViewportManager:
                 x_offset = 0  # Track x position for calling points row
                 
                 for component in row_data['components']:
-                    if component['type'] == 'full_width':
+                    component_type = component['type']
+                    if component_type == 'full_width':
                         self.add_hotspot(viewport, component['snapshot'], 0, y)
-                    elif dimensions:  # Only use dimensions for departure rows
-                        w = dimensions['status_width']
-                        pw = dimensions['platform_width']
-                        tw = dimensions['time_width']
-                        spacing = dimensions['spacing']
-                        
-                        if component['type'] == 'destination':
-                            if row_name == 'row_two':  # Calling points row
-                                self.add_hotspot(viewport, component['snapshot'], x_offset, y)
-                                x_offset += component['snapshot'].width  # Update x position for next component
-                            else:
-                                self.add_hotspot(viewport, component['snapshot'], 0, y)
-                        elif component['type'] == 'time':
-                            x = width - w - pw - tw - spacing * (2 if platform_enabled else 1)
-                            self.add_hotspot(viewport, component['snapshot'], x, y)
-                        elif component['type'] == 'status':
-                            x = width - w - (pw + spacing if platform_enabled else 0)
-                            self.add_hotspot(viewport, component['snapshot'], x, y)
-                        elif component['type'] == 'platform' and platform_enabled:
-                            self.add_hotspot(viewport, component['snapshot'], width - pw, y)
+                    elif row_name == 'row_two' and component_type == 'destination' and column_x:  # Calling points row
+                        self.add_hotspot(viewport, component['snapshot'], x_offset, y)
+                        x_offset += component['snapshot'].width  # Update x position for next component
+                    elif component_type in column_x:
+                        self.add_hotspot(viewport, component['snapshot'], column_x[component_type], y)
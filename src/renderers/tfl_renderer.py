@@ -49,7 +49,7 @@ class TflRenderer(BaseRenderer):
         rows['row_one']['components'] = self._create_departure_row(departures[0], firstFont, '1st', dimensions, width)
 
         # Calling points
-        callingWidth = int(self.font.getlength("Calling at: "))
+        callingWidth = int(self.cachedTextLength("Calling at: ", self.font))
         rows['row_two']['components'] = [
             {'type': 'destination', 'snapshot': self.viewport_manager.create_snapshot(callingWidth, 10, self.renderCallingAt, self.config["refreshTime"])},
             {'type': 'destination', 'snapshot': self.viewport_manager.create_snapshot(width - callingWidth, 10, lambda *args: self.renderStations(firstDepartureDestinations, *args), 0.02)}
@@ -170,9 +170,9 @@ class TflRenderer(BaseRenderer):
         }
 
         # Calculate text sizes
-        nameSize = int(self.fontBold.getlength("UK Train Departure Display"))
-        poweredSize = int(self.fontBold.getlength("Powered by"))
-        attributionSize = int(self.fontBold.getlength("Transport for London"))
+        nameSize = int(self.cachedTextLength("UK Train Departure Display", self.fontBold))
+        poweredSize = int(self.cachedTextLength("Powered by", self.fontBold))
+        attributionSize = int(self.cachedTextLength("Transport for London", self.fontBold))
 
         # Create snapshots
         rows['startup']['components'] = [{
@@ -207,7 +207,7 @@ class TflRenderer(BaseRenderer):
 
         # Calculate text position
         noTrains = "No trains from " + departureStation
-        noTrainsWidth = int(self.font.getlength(noTrains))
+        noTrainsWidth = int(self.cachedTextLength(noTrains, self.font))
         noTrainsX = (width - noTrainsWidth) / 2
 
         # Create snapshots